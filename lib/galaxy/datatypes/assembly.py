@@ -17,6 +17,12 @@ from galaxy.datatypes.text import Html
 
 log = logging.getLogger(__name__)
 
+# Sniffer patterns, compiled once rather than on every sniffed upload
+AMOS_RECORD_RE = re.compile(r'{(RED|CTG|TLE)$')
+VELVET_SEQUENCE_HEADER_RE = re.compile(r'>[^\t]+\t\d+\t\d+$')
+ROADMAP_HEADER_RE = re.compile(r'\d+\t\d+\t\d+$')
+ROADMAP_LINE_RE = re.compile(r'ROADMAP \d+$')
+
 
 class Amos( data.Text ):
     """Class describing the AMOS assembly file """
@@ -60,7 +66,7 @@ class Amos( data.Text ):
                 line = line.strip()
                 if line:  # first non-empty line
                     if line.startswith( '{' ):
-                        if re.match(r'{(RED|CTG|TLE)$', line):
+                        if AMOS_RECORD_RE.match(line):
                             isAmos = True
             fh.close()
         except:
@@ -92,7 +98,7 @@ class Sequences( sequence.Fasta ):
                 line = line.strip()
                 if line:  # first non-empty line
                     if line.startswith( '>' ):
-                        if not re.match(r'>[^\t]+\t\d+\t\d+$', line):
+                        if not VELVET_SEQUENCE_HEADER_RE.match(line):
                             break
                         # The next line.strip() must not be '', nor startwith '>'
                         line = fh.readline().strip()
@@ -128,11 +134,11 @@ class Roadmaps( data.Text ):
                     break  # EOF
                 line = line.strip()
                 if line:  # first non-empty line
-                    if not re.match(r'\d+\t\d+\t\d+$', line):
+                    if not ROADMAP_HEADER_RE.match(line):
                         break
                     # The next line.strip() should be 'ROADMAP 1'
                     line = fh.readline().strip()
-                    if not re.match(r'ROADMAP \d+$', line):
+                    if not ROADMAP_LINE_RE.match(line):
                         break
                     return True
                 else:
@@ -159,17 +165,16 @@ class Velvet( Html ):
         self.add_composite_file( 'Log', mimetype='text/html', description='Log', optional='True', substitute_name_with_metadata=None, is_binary=False )
 
     def generate_primary_file( self, dataset=None ):
-        log.debug( "Velvet log info  %s %s" % ('JJ generate_primary_file', dataset))
+        log.debug( "Velvet log info  %s %s", 'JJ generate_primary_file', dataset)
         rval = ['<html><head><title>Velvet Galaxy Composite Dataset </title></head><p/>']
         rval.append('<div>This composite dataset is composed of the following files:<p/><ul>')
         for composite_name, composite_file in self.get_composite_files( dataset=dataset ).items():
             fn = composite_name
-            log.debug( "Velvet log info  %s %s %s" % ('JJ generate_primary_file', fn, composite_file))
-            opt_text = ''
-            if composite_file.optional:
-                opt_text = ' (optional)'
-            if composite_file.get('description'):
-                rval.append( '<li><a href="%s" type="text/plain">%s (%s)</a>%s</li>' % ( fn, fn, composite_file.get('description'), opt_text ) )
+            log.debug( "Velvet log info  %s %s %s", 'JJ generate_primary_file', fn, composite_file)
+            description = composite_file.get( 'description' )
+            opt_text = ' (optional)' if composite_file.optional else ''
+            if description:
+                rval.append( '<li><a href="%s" type="text/plain">%s (%s)</a>%s</li>' % ( fn, fn, description, opt_text ) )
             else:
                 rval.append( '<li><a href="%s" type="text/plain">%s</a>%s</li>' % ( fn, fn, opt_text ) )
         rval.append( '</ul></div></html>' )
@@ -179,7 +184,7 @@ class Velvet( Html ):
         """
         cannot do this until we are setting metadata
         """
-        log.debug( "Velvet log info  %s" % 'JJ regenerate_primary_file')
+        log.debug( "Velvet log info  %s", 'JJ regenerate_primary_file')
         gen_msg = ''
         try:
             efp = dataset.extra_files_path
@@ -188,14 +193,14 @@ class Velvet( Html ):
             log_content = f.read(1000)
             f.close()
             log_msg = re.sub('/\S*/', '', log_content)
-            log.debug( "Velveth log info  %s" % log_msg)
+            log.debug( "Velveth log info  %s", log_msg)
             paired_end_reads = re.search('-(short|long)Paired', log_msg) is not None
             dataset.metadata.paired_end_reads = paired_end_reads
             long_reads = re.search('-long', log_msg) is not None
             dataset.metadata.long_reads = long_reads
             short2_reads = re.search('-short(Paired)?2', log_msg) is not None
             dataset.metadata.short2_reads = short2_reads
-            dataset.info = re.sub('.*velveth \S+', 'hash_length', re.sub('\n', ' ', log_msg))
+            dataset.info = re.sub('.*velveth \S+', 'hash_length', log_msg.replace('\n', ' '))
             if paired_end_reads:
                 gen_msg = gen_msg + ' Paired-End Reads'
             if long_reads:
@@ -203,21 +208,20 @@ class Velvet( Html ):
             if len(gen_msg) > 0:
                 gen_msg = 'Uses: ' + gen_msg
         except:
-            log.debug( "Velveth could not read Log file in %s" % efp)
-        log.debug( "Velveth log info  %s" % gen_msg)
+            log.debug( "Velveth could not read Log file in %s", efp)
+        log.debug( "Velveth log info  %s", gen_msg)
         rval = ['<html><head><title>Velvet Galaxy Composite Dataset </title></head><p/>']
         # rval.append('<div>Generated:<p/><code> %s </code></div>' %(re.sub('\n','<br>',log_msg)))
         rval.append('<div>Generated:<p/> %s </div>' % (gen_msg))
         rval.append('<div>Velveth dataset:<p/><ul>')
         for composite_name, composite_file in self.get_composite_files( dataset=dataset ).items():
             fn = composite_name
-            log.debug( "Velvet log info  %s %s %s" % ('JJ regenerate_primary_file', fn, composite_file))
-            if re.search('Log', fn) is None:
-                opt_text = ''
-                if composite_file.optional:
-                    opt_text = ' (optional)'
-                if composite_file.get('description'):
-                    rval.append( '<li><a href="%s" type="text/plain">%s (%s)</a>%s</li>' % ( fn, fn, composite_file.get('description'), opt_text ) )
+            log.debug( "Velvet log info  %s %s %s", 'JJ regenerate_primary_file', fn, composite_file)
+            if 'Log' not in fn:
+                description = composite_file.get( 'description' )
+                opt_text = ' (optional)' if composite_file.optional else ''
+                if description:
+                    rval.append( '<li><a href="%s" type="text/plain">%s (%s)</a>%s</li>' % ( fn, fn, description, opt_text ) )
                 else:
                     rval.append( '<li><a href="%s" type="text/plain">%s</a>%s</li>' % ( fn, fn, opt_text ) )
         rval.append( '</ul></div></html>' )
@@ -1,5 +1,4 @@
 """Binary classes"""
-from __future__ import print_function
 
 import binascii
 import gzip
@@ -22,6 +21,20 @@ from . import data, dataproviders
 
 log = logging.getLogger(__name__)
 
+# Local file header signature that starts every non-empty zip archive
+ZIP_MAGIC = b'PK\x03\x04'
+
+
+def _has_zip_magic( filename ):
+    """
+    Cheap pre-check for zip based sniffers: reads the first 4 bytes instead
+    of letting zipfile look for a central directory at the end of every
+    uploaded file.
+    """
+    with open( filename, 'rb' ) as fh:
+        return fh.read( len( ZIP_MAGIC ) ) == ZIP_MAGIC
+
+
 # Currently these supported binary data types must be manually set on upload
 
 
@@ -279,7 +292,7 @@ class Bam( Binary ):
                 shutil.rmtree(tmp_dir)  # clean up
                 raise Exception( "Error merging BAM files: %s" % stderr )
             else:
-                print(stderr)
+                log.debug( "samtools merge stderr: %s", stderr )
         os.unlink(stderr_name)
         os.rmdir(tmp_dir)
 
@@ -353,7 +366,9 @@ class Bam( Binary ):
         if not self.dataset_content_needs_grooming( file_name ):
             # Don't re-sort if already sorted
             return
-        tmp_dir = tempfile.mkdtemp()
+        # Create the temp directory next to the dataset, so the final move of
+        # the sorted file is a rename rather than a copy across filesystems.
+        tmp_dir = tempfile.mkdtemp( dir=os.path.dirname( os.path.abspath( file_name ) ) )
         tmp_sorted_dataset_file_name_prefix = os.path.join( tmp_dir, 'sorted' )
         stderr_name = tempfile.NamedTemporaryFile( dir=tmp_dir, prefix="bam_sort_stderr" ).name
         samtools_created_sorted_file_name = "%s.bam" % tmp_sorted_dataset_file_name_prefix  # samtools accepts a prefix, not a filename, it always adds .bam to the prefix
@@ -367,7 +382,7 @@ class Bam( Binary ):
                 shutil.rmtree( tmp_dir)  # clean up
                 raise Exception( "Error Grooming BAM file contents: %s" % stderr )
             else:
-                print(stderr)
+                log.debug( "samtools sort stderr: %s", stderr )
         # Move samtools_created_sorted_file_name to our output dataset location
         shutil.move( samtools_created_sorted_file_name, file_name )
         # Remove temp file and empty temporary directory
@@ -410,7 +425,7 @@ class Bam( Binary ):
                 os.unlink( stderr_name )  # clean up
                 raise Exception( "Error Setting BAM Metadata: %s" % stderr )
             else:
-                print(stderr)
+                log.debug( "samtools index stderr: %s", stderr )
         dataset.metadata.bam_index = index_file
         # Remove temp file
         os.unlink( stderr_name )
@@ -1106,13 +1121,21 @@ class Xlsx(Binary):
     file_ext = "xlsx"
 
     def sniff( self, filename ):
+        """
+        >>> from galaxy.datatypes.sniff import get_test_fname
+        >>> fname = get_test_fname( '1.bam' )
+        >>> Xlsx().sniff( fname )
+        False
+        """
         # Xlsx is compressed in zip format and must not be uncompressed in Galaxy.
         try:
-            if zipfile.is_zipfile( filename ):
-                tempzip = zipfile.ZipFile( filename )
-                if "[Content_Types].xml" in tempzip.namelist() and tempzip.read("[Content_Types].xml").find(b'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml') != -1:
-                    return True
-            return False
+            if not _has_zip_magic( filename ):
+                return False
+            tempzip = zipfile.ZipFile( filename )
+            try:
+                return "[Content_Types].xml" in tempzip.namelist() and tempzip.read("[Content_Types].xml").find(b'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml') != -1
+            finally:
+                tempzip.close()
         except:
             return False
 
@@ -1370,7 +1393,7 @@ class SearchGuiArchive ( CompressedArchive ):
     def set_meta( self, dataset, overwrite=True, **kwd ):
         super( SearchGuiArchive, self ).set_meta( dataset, overwrite=overwrite, **kwd )
         try:
-            if dataset and zipfile.is_zipfile( dataset.file_name ):
+            if dataset:
                 tempzip = zipfile.ZipFile( dataset.file_name )
                 if 'searchgui.properties' in tempzip.namelist():
                     fh = tempzip.open('searchgui.properties')
@@ -1386,7 +1409,7 @@ class SearchGuiArchive ( CompressedArchive ):
 
     def sniff( self, filename ):
         try:
-            if filename and zipfile.is_zipfile( filename ):
+            if filename and _has_zip_magic( filename ):
                 tempzip = zipfile.ZipFile( filename, 'r' )
                 is_searchgui = 'searchgui.properties' in tempzip.namelist()
                 tempzip.close()
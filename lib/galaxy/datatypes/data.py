@@ -4,6 +4,7 @@ import abc
 import logging
 import mimetypes
 import os
+import re
 import shutil
 import string
 import tempfile
@@ -42,6 +43,9 @@ valid_strand = ['+', '-', '.']
 DOWNLOAD_FILENAME_PATTERN_DATASET = "Galaxy${hid}-[${name}].${ext}"
 DOWNLOAD_FILENAME_PATTERN_COLLECTION_ELEMENT = "Galaxy${hdca_hid}-[${hdca_name}__${element_identifier}].${ext}"
 
+# Any character above 128, the threshold get_file_peek uses to call a file binary
+PEEK_BINARY_CHAR_RE = re.compile( u'[^\x00-\x80]' )
+
 
 class DataMeta( abc.ABCMeta ):
     """
@@ -115,19 +119,13 @@ class Data( object ):
 
     def write_from_stream(self, dataset, stream):
         """Writes data from a stream"""
-        fd = open(dataset.file_name, 'wb')
-        while True:
-            chunk = stream.read(1048576)
-            if not chunk:
-                break
-            os.write(fd, chunk)
-        os.close(fd)
+        with open(dataset.file_name, 'wb') as fh:
+            shutil.copyfileobj(stream, fh, 1048576)
 
     def set_raw_data(self, dataset, data):
         """Saves the data on the disc"""
-        fd = open(dataset.file_name, 'wb')
-        os.write(fd, data)
-        os.close(fd)
+        with open(dataset.file_name, 'wb') as fh:
+            fh.write(data)
 
     def get_raw_data( self, dataset ):
         """Returns the full data. To stream it open the file_name and read/write as needed"""
@@ -310,9 +308,11 @@ class Data( object ):
     def __archive_extra_files_path(self, extra_files_path):
         """Yield filepaths and relative filepaths for files in extra_files_path"""
         for root, dirs, files in os.walk(extra_files_path):
+            # Resolve the relative directory once rather than once per file
+            rel_root = os.path.relpath(root, extra_files_path)
             for fname in files:
                 fpath = os.path.join(root, fname)
-                rpath = os.path.relpath(fpath, extra_files_path)
+                rpath = fname if rel_root == os.curdir else os.path.join(rel_root, fname)
                 yield fpath, rpath
 
     def _serve_raw(self, trans, dataset, to_ext, **kwd):
@@ -693,13 +693,11 @@ class Data( object ):
         """
         if not split_files:
             raise ValueError('Asked to merge zero files as %s' % output_file)
-        elif len(split_files) == 1:
-            shutil.copyfileobj(open(split_files[0], 'rb'), open(output_file, 'wb'))
-        else:
-            fdst = open(output_file, 'wb')
+        with open(output_file, 'wb') as fdst:
             for fsrc in split_files:
-                shutil.copyfileobj(open(fsrc, 'rb'), fdst)
-            fdst.close()
+                with open(fsrc, 'rb') as fh:
+                    # Use 1 MB reads instead of the 16 KB copyfileobj default.
+                    shutil.copyfileobj(fh, fdst, 1048576)
 
     merge = staticmethod(merge)
 
@@ -760,34 +758,34 @@ class Text( Data ):
     MetadataElement( name="data_lines", default=0, desc="Number of data lines", readonly=True, optional=True, visible=False, no_value=0 )
 
     def write_from_stream(self, dataset, stream):
-        """Writes data from a stream"""
-        # write it twice for now
-        fd, temp_name = tempfile.mkstemp()
-        while True:
-            chunk = stream.read(1048576)
-            if not chunk:
-                break
-            os.write(fd, chunk)
-        os.close(fd)
-        # rewrite the file with unix newlines
-        fp = open(dataset.file_name, 'w')
-        for line in open(temp_name, "U"):
-            line = line.strip() + '\n'
-            fp.write(line)
-        fp.close()
+        """Writes data from a stream, converting to unix newlines on the fly"""
+        with open(dataset.file_name, 'wb') as fp:
+            # Pieces of a line that spans several chunks are collected and
+            # only joined once a line break arrives. A trailing '\r' is held
+            # back, so a '\r\n' split across two chunks is kept together.
+            pending = []
+            while True:
+                chunk = stream.read(1048576)
+                if not chunk:
+                    break
+                split_at = len(chunk.rstrip(b'\r'))
+                end = max(chunk.rfind(b'\n', 0, split_at), chunk.rfind(b'\r', 0, split_at)) + 1
+                if not end:
+                    pending.append(chunk)
+                    continue
+                pending.append(chunk[:end])
+                for line in b''.join(pending).splitlines():
+                    fp.write(line.strip() + b'\n')
+                pending = [chunk[end:]]
+            for line in b''.join(pending).splitlines():
+                fp.write(line.strip() + b'\n')
 
     def set_raw_data(self, dataset, data):
         """Saves the data on the disc"""
-        fd, temp_name = tempfile.mkstemp()
-        os.write(fd, data)
-        os.close(fd)
-        # rewrite the file with unix newlines
-        fp = open(dataset.file_name, 'w')
-        for line in open(temp_name, "U"):
-            line = line.strip() + '\n'
-            fp.write(line)
-        fp.close()
-        os.remove( temp_name )
+        # rewrite the data with unix newlines
+        with open(dataset.file_name, 'wb') as fp:
+            for line in data.splitlines():
+                fp.write(line.strip() + b'\n')
 
     def get_mime(self):
         """Returns the mime type of the datatype"""
@@ -1060,10 +1058,8 @@ def get_file_peek( file_name, is_multi_byte=False, WIDTH=256, LINE_COUNT=5, skip
             line = temp.readline( WIDTH )
             if line and not is_multi_byte and not data_checked:
                 # See if we have a compressed or binary file
-                for char in line:
-                    if ord( char ) > 128:
-                        file_type = 'binary'
-                        break
+                if PEEK_BINARY_CHAR_RE.search( line ):
+                    file_type = 'binary'
                 data_checked = True
                 if file_type == 'binary':
                     break
@@ -1071,9 +1067,11 @@ def get_file_peek( file_name, is_multi_byte=False, WIDTH=256, LINE_COUNT=5, skip
                 if line.endswith('\n'):
                     line = line[:-1]
                 else:
+                    # Skip the rest of the truncated line in blocks, not
+                    # one character at a time.
                     while True:
-                        i = temp.read(1)
-                        if not i or i == '\n':
+                        rest = temp.readline( 65536 )
+                        if not rest or rest.endswith( '\n' ):
                             break
             skip_line = False
             for skipchar in skipchars:
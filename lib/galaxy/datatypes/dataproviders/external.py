@@ -50,7 +50,7 @@ class SubprocessDataProvider( base.DataProvider ):
         try:
             # how expensive is this?
             popen = subprocess.Popen( command_list, stderr=subprocess.PIPE, stdout=subprocess.PIPE )
-            log.info( 'opened subrocess (%s), PID: %s' % ( str( command_list ), str( popen.pid ) ) )
+            log.info( 'opened subrocess (%s), PID: %s', command_list, popen.pid )
 
         except OSError as os_err:
             command_str = ' '.join( self.command )
@@ -61,7 +61,7 @@ class SubprocessDataProvider( base.DataProvider ):
     def __exit__( self, *args ):
         # poll the subrocess for an exit code
         self.exit_code = self.popen.poll()
-        log.info( '%s.__exit__, exit_code: %s' % ( str( self ), str( self.exit_code ) ) )
+        log.info( '%s.__exit__, exit_code: %s', self, self.exit_code )
         return super( SubprocessDataProvider, self ).__exit__( *args )
 
     def __str__( self ):
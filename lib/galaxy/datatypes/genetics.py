@@ -11,6 +11,7 @@ subsequent row values are all numeric ! Will fail if any non numeric (eg '+' or
 ross lazarus for rgenetics
 august 20 2007
 """
+import itertools
 import logging
 import os
 import re
@@ -53,7 +54,8 @@ class GenomeGraphs( Tabular ):
     def set_meta(self, dataset, **kwd):
         Tabular.set_meta( self, dataset, **kwd)
         dataset.metadata.markerCol = 1
-        header = open(dataset.file_name, 'r').readlines()[0].strip().split('\t')
+        with open(dataset.file_name, 'r') as fh:
+            header = fh.readline().strip().split('\t')
         dataset.metadata.columns = len(header)
         t = ['numeric' for x in header]
         t[0] = 'string'
@@ -119,7 +121,7 @@ class GenomeGraphs( Tabular ):
         out = ['<table cellspacing="0" cellpadding="3">']
         try:
             with open(dataset.file_name, 'r') as f:
-                d = f.readlines()[:5]
+                d = list(itertools.islice(f, 5))
             if len(d) == 0:
                 out = "Cannot find anything to parse in %s" % dataset.name
                 return out
@@ -288,14 +290,12 @@ class Rgenetics(Html):
         rval = ['<html><head><title>Rgenetics Galaxy Composite Dataset </title></head><p/>']
         rval.append('<div>This composite dataset is composed of the following files:<p/><ul>')
         for composite_name, composite_file in self.get_composite_files( dataset=dataset ).items():
-            fn = composite_name
-            opt_text = ''
-            if composite_file.optional:
-                opt_text = ' (optional)'
-            if composite_file.get('description'):
-                rval.append( '<li><a href="%s" type="application/binary">%s (%s)</a>%s</li>' % ( fn, fn, composite_file.get('description'), opt_text ) )
+            description = composite_file.get( 'description' )
+            opt_text = ' (optional)' if composite_file.optional else ''
+            if description:
+                rval.append( '<li><a href="%s" type="application/binary">%s (%s)</a>%s</li>' % ( composite_name, composite_name, description, opt_text ) )
             else:
-                rval.append( '<li><a href="%s" type="application/binary">%s</a>%s</li>' % ( fn, fn, opt_text ) )
+                rval.append( '<li><a href="%s" type="application/binary">%s</a>%s</li>' % ( composite_name, composite_name, opt_text ) )
         rval.append( '</ul></div></html>' )
         return "\n".join( rval )
 
@@ -303,13 +303,14 @@ class Rgenetics(Html):
         """
         cannot do this until we are setting metadata
         """
-        efp = dataset.extra_files_path
-        flist = os.listdir(efp)
+        self._write_primary_file(dataset, os.listdir(dataset.extra_files_path))
+
+    def _write_primary_file(self, dataset, flist):
+        """
+        write the primary file from flist, the listing of dataset.extra_files_path
+        """
         rval = ['<html><head><title>Files for Composite Dataset %s</title></head><body><p/>Composite %s contains:<p/><ul>' % (dataset.name, dataset.name)]
-        for i, fname in enumerate(flist):
-            sfname = os.path.split(fname)[-1]
-            f, e = os.path.splitext(fname)
-            rval.append( '<li><a href="%s">%s</a></li>' % ( sfname, sfname) )
+        rval.extend( '<li><a href="%s">%s</a></li>' % ( fname, fname ) for fname in flist )
         rval.append( '</ul></body></html>' )
         with open(dataset.file_name, 'w') as f:
             f.write("\n".join( rval ))
@@ -334,19 +335,19 @@ class Rgenetics(Html):
             efp = dataset.extra_files_path
         except:
             if verbose:
-                gal_Log.debug('@@@rgenetics set_meta failed %s - dataset %s has no efp ?' % (sys.exc_info()[0], dataset.name))
+                gal_Log.debug('@@@rgenetics set_meta failed %s - dataset %s has no efp ?', sys.exc_info()[0], dataset.name)
             return False
         try:
             flist = os.listdir(efp)
         except:
             if verbose:
-                gal_Log.debug('@@@rgenetics set_meta failed %s - dataset %s has no efp ?' % (sys.exc_info()[0], dataset.name))
+                gal_Log.debug('@@@rgenetics set_meta failed %s - dataset %s has no efp ?', sys.exc_info()[0], dataset.name)
             return False
         if len(flist) == 0:
             if verbose:
-                gal_Log.debug('@@@rgenetics set_meta failed - %s efp %s is empty?' % (dataset.name, efp))
+                gal_Log.debug('@@@rgenetics set_meta failed - %s efp %s is empty?', dataset.name, efp)
             return False
-        self.regenerate_primary_file(dataset)
+        self._write_primary_file(dataset, flist)
         if not dataset.info:
             dataset.info = 'Galaxy genotype datatype object'
         if not dataset.blurb:
@@ -655,10 +656,11 @@ class RexpBase( Html ):
         if not dataset.dataset.purged:
             pp = os.path.join(dataset.extra_files_path, '%s.pheno' % dataset.metadata.base_name)
             try:
-                p = open(pp, 'r').readlines()
+                with open(pp, 'r') as fh:
+                    p = list(itertools.islice(fh, 5))
             except:
                 p = ['##failed to find %s' % pp, ]
-            dataset.peek = ''.join(p[:5])
+            dataset.peek = ''.join(p)
             dataset.blurb = 'Galaxy Rexpression composite file'
         else:
             dataset.peek = 'file does not exist\n'
@@ -670,21 +672,23 @@ class RexpBase( Html ):
         """
         pp = os.path.join(dataset.extra_files_path, '%s.pheno' % dataset.metadata.base_name)
         try:
-            p = open(pp, 'r').readlines()
+            with open(pp, 'r') as fh:
+                p = list(itertools.islice(fh, 5))
         except:
             p = ['##failed to find %s' % pp]
-        return ''.join(p[:5])
+        return ''.join(p)
 
     def get_file_peek(self, filename):
         """
         can't really peek at a filename - need the extra_files_path and such?
         """
-        h = '## rexpression get_file_peek: no file found'
+        h = ['## rexpression get_file_peek: no file found']
         try:
-            h = open(filename, 'r').readlines()
+            with open(filename, 'r') as fh:
+                h = list(itertools.islice(fh, 5))
         except:
             pass
-        return ''.join(h[:5])
+        return ''.join(h)
 
     def regenerate_primary_file(self, dataset):
         """
@@ -693,9 +697,7 @@ class RexpBase( Html ):
         bn = dataset.metadata.base_name
         flist = os.listdir(dataset.extra_files_path)
         rval = ['<html><head><title>Files for Composite Dataset %s</title></head><p/>Comprises the following files:<p/><ul>' % (bn)]
-        for i, fname in enumerate(flist):
-            sfname = os.path.split(fname)[-1]
-            rval.append( '<li><a href="%s">%s</a>' % ( sfname, sfname ) )
+        rval.extend( '<li><a href="%s">%s</a>' % ( fname, fname ) for fname in flist )
         rval.append( '</ul></html>' )
         with open(dataset.file_name, 'w') as f:
             f.write("\n".join( rval ))
@@ -720,11 +722,10 @@ class RexpBase( Html ):
                 gal_Log.debug('@@@rexpression set_meta failed - no dataset?')
             return False
         bn = dataset.metadata.base_name
-        if not bn:
-            for f in flist:
-                n = os.path.splitext(f)[0]
-                bn = n
-                dataset.metadata.base_name = bn
+        if not bn and flist:
+            # the last listed file wins, as it always has - set the metadata once
+            bn = os.path.splitext(flist[-1])[0]
+            dataset.metadata.base_name = bn
         if not bn:
             bn = '?'
             dataset.metadata.base_name = bn
@@ -238,18 +238,19 @@ class Gmaj( data.Data ):
         correctly sniffed, but the files can be uploaded (they'll be sniffed as 'txt').  This sniff function
         is here to provide an example of a sniffer for a zip file.
         """
-        if not zipfile.is_zipfile( filename ):
-            return False
-        contains_gmaj_file = False
-        zip_file = zipfile.ZipFile(filename, "r")
-        for name in zip_file.namelist():
-            if name.split(".")[1].strip().lower() == 'gmaj':
-                contains_gmaj_file = True
-                break
-        zip_file.close()
-        if not contains_gmaj_file:
+        # Opening the archive reads its central directory, so a separate
+        # zipfile.is_zipfile() call would just read it twice.
+        try:
+            zip_file = zipfile.ZipFile( filename, "r" )
+        except ( IOError, zipfile.BadZipfile ):
             return False
-        return True
+        try:
+            for name in zip_file.namelist():
+                if name.split(".")[1].strip().lower() == 'gmaj':
+                    return True
+        finally:
+            zip_file.close()
+        return False
 
 
 class Html( HtmlFromText ):
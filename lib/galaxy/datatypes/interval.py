@@ -7,7 +7,6 @@ import os
 import sys
 import tempfile
 
-import numpy
 from bx.intervals.io import GenomicIntervalReader, ParseError
 from six.moves.urllib.parse import quote_plus
 
@@ -1263,6 +1262,9 @@ class Wiggle( Tabular, _RemoteCallMixin ):
         """
         Assumes we have a numpy file.
         """
+        # Import here so that loading the datatypes registry doesn't pay for numpy
+        import numpy
+
         range = end - start
         # Determine appropriate resolution to plot ~1000 points
         resolution = ( 10 ** math.ceil( math.log10( range / 1000 ) ) )
@@ -808,11 +808,12 @@ class CML(GenericXml):
                         out.write(header)
                         raise ValueError("%s is not a CML file!" % filename)
                     molecule_found = False
-                    for line in handle.readlines():
+                    for line in handle:
                         # We found two required header lines, the next line should start with <molecule >
-                        if line.lstrip().startswith('</cml>'):
+                        stripped = line.lstrip()
+                        if stripped.startswith('</cml>'):
                             continue
-                        if line.lstrip().startswith('<molecule'):
+                        if stripped.startswith('<molecule'):
                             molecule_found = True
                         if molecule_found:
                             out.write(line)
@@ -914,19 +914,20 @@ class SffFlow(Tabular):
 
     def make_html_table(self, dataset, skipchars=[]):
         """Create HTML table, used for displaying peek"""
+        out = ['<table cellspacing="0" cellpadding="3">']
         try:
-            out = '<table cellspacing="0" cellpadding="3">'
-
             # Generate column header
-            out += '<tr>'
-            out += '<th>%d. Name</th>' % 1
-            out += '<th>%d. Flows</th>' % 2
+            out.append('<tr>')
+            out.append('<th>%d. Name</th>' % 1)
+            out.append('<th>%d. Flows</th>' % 2)
+            flow_order = dataset.metadata.flow_order
             for i in range(3, dataset.metadata.columns + 1):
-                base = dataset.metadata.flow_order[(i + 1) % 4]
-                out += '<th>%d. %d %s</th>' % (i - 2, base)
-            out += '</tr>'
-            out += self.make_html_peek_rows(dataset, skipchars=skipchars)
-            out += '</table>'
+                base = flow_order[(i + 1) % 4]
+                out.append('<th>%d. %d %s</th>' % (i, i - 2, base))
+            out.append('</tr>')
+            out.append(self.make_html_peek_rows(dataset, skipchars=skipchars))
+            out.append('</table>')
+            out = "".join(out)
         except Exception as exc:
             out = "Can't create peek %s" % str(exc)
         return out
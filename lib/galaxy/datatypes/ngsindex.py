@@ -36,9 +36,7 @@ class BowtieIndex( Html ):
         bn = dataset.metadata.base_name
         flist = os.listdir(dataset.extra_files_path)
         rval = ['<html><head><title>Files for Composite Dataset %s</title></head><p/>Comprises the following files:<p/><ul>' % (bn)]
-        for i, fname in enumerate(flist):
-            sfname = os.path.split(fname)[-1]
-            rval.append( '<li><a href="%s">%s</a>' % ( sfname, sfname ) )
+        rval.extend( '<li><a href="%s">%s</a>' % ( fname, fname ) for fname in flist )
         rval.append( '</ul></html>' )
         with open(dataset.file_name, 'w') as f:
             f.write("\n".join( rval ))
@@ -9,6 +9,8 @@ from galaxy.util import nice_size
 
 log = logging.getLogger(__name__)
 
+SMAT_INTEGER_RE = re.compile(r"[-+]?\d+$")
+
 
 class Smat(Text):
     file_ext = "smat"
@@ -68,7 +70,7 @@ class Smat(Text):
                         return False
                     for item in items:
                         # Make sure each item is an integer.
-                        if re.match(r"[-+]?\d+$", item) is None:
+                        if SMAT_INTEGER_RE.match(item) is None:
                             return False
         return True
 
@@ -14,6 +14,22 @@ from galaxy.util import nice_size
 
 log = logging.getLogger(__name__)
 
+COMPOSITE_FILES_HEADER = '<div>This composite dataset is composed of the following files:<p/><ul>'
+COMPOSITE_FILE_ITEM = '<li><a href="%s" type="text/plain">%s%s</a>%s</li>'
+COMPOSITE_FILES_FOOTER = '</ul></div></html>'
+
+
+def _composite_primary_file(title, composite_files):
+    """Return the html listing of ``composite_files`` shared by the composite proteomics datatypes."""
+    rval = ['<html><head><title>%s</title></head><p/>' % title, COMPOSITE_FILES_HEADER]
+    for composite_name, composite_file in composite_files.items():
+        description = composite_file.get('description')
+        rval.append(COMPOSITE_FILE_ITEM % (composite_name, composite_name,
+                                           ' (%s)' % description if description else '',
+                                           ' (optional)' if composite_file.optional else ''))
+    rval.append(COMPOSITE_FILES_FOOTER)
+    return "\n".join(rval)
+
 
 class Wiff(Binary):
     """Class for wiff files."""
@@ -37,19 +53,7 @@ class Wiff(Binary):
             optional='True', is_binary=True)
 
     def generate_primary_file(self, dataset=None):
-        rval = ['<html><head><title>Wiff Composite Dataset </title></head><p/>']
-        rval.append('<div>This composite dataset is composed of the following files:<p/><ul>')
-        for composite_name, composite_file in self.get_composite_files(dataset=dataset).items():
-            fn = composite_name
-            opt_text = ''
-            if composite_file.optional:
-                opt_text = ' (optional)'
-            if composite_file.get('description'):
-                rval.append('<li><a href="%s" type="text/plain">%s (%s)</a>%s</li>' % (fn, fn, composite_file.get('description'), opt_text))
-            else:
-                rval.append('<li><a href="%s" type="text/plain">%s</a>%s</li>' % (fn, fn, opt_text))
-        rval.append('</ul></div></html>')
-        return "\n".join(rval)
+        return _composite_primary_file('Wiff Composite Dataset ', self.get_composite_files(dataset=dataset))
 
 
 Binary.register_sniffable_binary_format("wiff", "wiff", Wiff )
@@ -357,19 +361,7 @@ class SPLib(Msp):
                                 description='Peptide index', is_binary=False)
 
     def generate_primary_file(self, dataset=None):
-        rval = ['<html><head><title>Spectral Library Composite Dataset </title></head><p/>']
-        rval.append('<div>This composite dataset is composed of the following files:<p/><ul>')
-        for composite_name, composite_file in self.get_composite_files(dataset=dataset).items():
-            fn = composite_name
-            opt_text = ''
-            if composite_file.optional:
-                opt_text = ' (optional)'
-            if composite_file.get('description'):
-                rval.append('<li><a href="%s" type="text/plain">%s (%s)</a>%s</li>' % (fn, fn, composite_file.get('description'), opt_text))
-            else:
-                rval.append('<li><a href="%s" type="text/plain">%s</a>%s</li>' % (fn, fn, opt_text))
-        rval.append('</ul></div></html>')
-        return "\n".join(rval)
+        return _composite_primary_file('Spectral Library Composite Dataset ', self.get_composite_files(dataset=dataset))
 
     def set_peek(self, dataset, is_multi_byte=False):
         """Set the peek and blurb text"""
@@ -107,9 +107,9 @@ class Registry( object ):
                 root = tree.getroot()
                 # Load datatypes and converters from config
                 if deactivate:
-                    self.log.debug('Deactivating datatypes from %s' % config)
+                    self.log.debug('Deactivating datatypes from %s', config)
                 else:
-                    self.log.debug('Loading datatypes from %s' % config)
+                    self.log.debug('Loading datatypes from %s', config)
             else:
                 root = config
             registration = root.find( 'registration' )
@@ -178,7 +178,7 @@ class Registry( object ):
                         del self.datatypes_by_extension[ extension ]
                         if extension in self.upload_file_formats:
                             self.upload_file_formats.remove( extension )
-                        self.log.debug( "Removed datatype with extension '%s' from the registry." % extension )
+                        self.log.debug( "Removed datatype with extension '%s' from the registry.", extension )
                 else:
                     # We are loading new datatype, so we'll make sure it is correctly defined before proceeding.
                     can_process_datatype = False
@@ -210,7 +210,7 @@ class Registry( object ):
                                             datatype_class = getattr( imported_module, datatype_class_name )
                                     except Exception as e:
                                         full_path = os.path.join( proprietary_path, proprietary_datatype_module )
-                                        self.log.debug( "Exception importing proprietary code file %s: %s" % ( str( full_path ), str( e ) ) )
+                                        self.log.debug( "Exception importing proprietary code file %s: %s", full_path, e )
                                 # Either the above exception was thrown because the proprietary_datatype_module is not derived from a class
                                 # in the repository, or we are loading Galaxy's datatypes. In either case we'll look in the registry.
                                 if datatype_class is None:
@@ -221,7 +221,7 @@ class Registry( object ):
                                         for mod in fields:
                                             module = getattr( module, mod )
                                         datatype_class = getattr( module, datatype_class_name )
-                                        self.log.debug( 'Retrieved datatype module %s:%s from the datatype registry.' % ( str( datatype_module ), datatype_class_name ) )
+                                        self.log.debug( 'Retrieved datatype module %s:%s from the datatype registry.', datatype_module, datatype_class_name )
                                     except Exception as e:
                                         self.log.exception( 'Error importing datatype module %s', str( datatype_module ) )
                                         ok = False
@@ -239,8 +239,8 @@ class Registry( object ):
                                 if extension in self.datatypes_by_extension:
                                     # Because of the way that the value of can_process_datatype was set above, we know that the value of
                                     # override is True.
-                                    self.log.debug( "Overriding conflicting datatype with extension '%s', using datatype from %s." %
-                                                    ( str( extension ), str( config ) ) )
+                                    self.log.debug( "Overriding conflicting datatype with extension '%s', using datatype from %s.",
+                                                    extension, config )
                                 if make_subclass:
                                     datatype_class = type( datatype_class_name, ( datatype_class, ), {} )
                                     if edam_format:
@@ -297,7 +297,7 @@ class Registry( object ):
                                     if not override:
                                         # Do not load the datatype since it conflicts with an existing datatype which we are not supposed
                                         # to override.
-                                        self.log.debug( "Ignoring conflicting datatype with extension '%s' from %s." % ( extension, config ) )
+                                        self.log.debug( "Ignoring conflicting datatype with extension '%s' from %s.", extension, config )
             # Load datatype sniffers from the config - we'll do this even if one or more datatypes were not properly processed in the config
             # since sniffers are not tightly coupled with datatypes.
             self.load_datatype_sniffers( root,
@@ -334,7 +334,7 @@ class Registry( object ):
             if not os.path.exists( path ):
                 sample_path = "%s.sample" % path
                 if os.path.exists( sample_path ):
-                    self.log.debug( "Build site file [%s] not found using sample [%s]." % ( path, sample_path ) )
+                    self.log.debug( "Build site file [%s] not found using sample [%s].", path, sample_path )
                     path = sample_path
 
             self.build_sites[site_type] = path
@@ -432,12 +432,12 @@ class Registry( object ):
                                             if sniffer_class == s_e_c:
                                                 del self.sniffer_elems[ index ]
                                                 sniffer_elem_classes = [ elem.attrib[ 'type' ] for elem in self.sniffer_elems ]
-                                                self.log.debug( "Removed sniffer element for datatype '%s'" % str( dtype ) )
+                                                self.log.debug( "Removed sniffer element for datatype '%s'", dtype )
                                                 break
                                         for sniffer_class in self.sniff_order:
                                             if sniffer_class.__class__ == aclass.__class__:
                                                 self.sniff_order.remove( sniffer_class )
-                                                self.log.debug( "Removed sniffer class for datatype '%s' from sniff order" % str( dtype ) )
+                                                self.log.debug( "Removed sniffer class for datatype '%s' from sniff order", dtype )
                                                 break
                                 else:
                                     # We are loading new sniffer, so see if we have a conflicting sniffer already loaded.
@@ -448,15 +448,15 @@ class Registry( object ):
                                             conflict = True
                                             if override:
                                                 del self.sniff_order[ conflict_loc ]
-                                                self.log.debug( "Removed conflicting sniffer for datatype '%s'" % dtype )
+                                                self.log.debug( "Removed conflicting sniffer for datatype '%s'", dtype )
                                             break
                                     if conflict:
                                         if override:
                                             self.sniff_order.append( aclass )
-                                            self.log.debug( "Loaded sniffer for datatype '%s'" % dtype )
+                                            self.log.debug( "Loaded sniffer for datatype '%s'", dtype )
                                     else:
                                         self.sniff_order.append( aclass )
-                                        self.log.debug( "Loaded sniffer for datatype '%s'" % dtype )
+                                        self.log.debug( "Loaded sniffer for datatype '%s'", dtype )
                                     # Processing the new sniffer elem is now complete, so make sure the element defining it is loaded if necessary.
                                     sniffer_class = elem.get( 'type', None )
                                     if sniffer_class is not None:
@@ -624,13 +624,13 @@ class Registry( object ):
                                     del self.datatypes_by_extension[ extension ].display_applications[ display_app.id ]
                             if inherit and ( self.datatypes_by_extension[ extension ], display_app ) in self.inherit_display_application_by_class:
                                 self.inherit_display_application_by_class.remove( ( self.datatypes_by_extension[ extension ], display_app ) )
-                            self.log.debug( "Deactivated display application '%s' for datatype '%s'." % ( display_app.id, extension ) )
+                            self.log.debug( "Deactivated display application '%s' for datatype '%s'.", display_app.id, extension )
                         else:
                             self.display_applications[ display_app.id ] = display_app
                             self.datatypes_by_extension[ extension ].add_display_application( display_app )
                             if inherit and ( self.datatypes_by_extension[ extension ], display_app ) not in self.inherit_display_application_by_class:
                                 self.inherit_display_application_by_class.append( ( self.datatypes_by_extension[ extension ], display_app ) )
-                            self.log.debug( "Loaded display application '%s' for datatype '%s', inherit=%s." % ( display_app.id, extension, inherit ) )
+                            self.log.debug( "Loaded display application '%s' for datatype '%s', inherit=%s.", display_app.id, extension, inherit )
                 except Exception:
                     if deactivate:
                         self.log.exception( "Error deactivating display application (%s)" % config_path )
@@ -641,7 +641,7 @@ class Registry( object ):
             for d_type2, display_app in self.inherit_display_application_by_class:
                 current_app = d_type1.get_display_application( display_app.id, None )
                 if current_app is None and isinstance( d_type1, type( d_type2 ) ):
-                    self.log.debug( "Adding inherited display application '%s' to datatype '%s'" % ( display_app.id, extension ) )
+                    self.log.debug( "Adding inherited display application '%s' to datatype '%s'", display_app.id, extension )
                     d_type1.add_display_application( display_app )
 
     def reload_display_applications( self, display_application_ids=None ):
@@ -910,6 +910,6 @@ class Registry( object ):
         # If extension is not None and is uppercase or mixed case, we need to lowercase it
         if extension is not None and not extension.islower():
             self.log.debug( "%s is not lower case, that could cause troubles in the future. \
-            Please change it to lower case" % extension )
+            Please change it to lower case", extension )
             extension = extension.lower()
         return extension
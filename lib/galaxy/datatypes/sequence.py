@@ -397,7 +397,7 @@ class Fasta( Sequence ):
             raise Exception('Tool does not define a split mode')
         elif split_params['split_mode'] == 'number_of_parts':
             split_size = int(split_params['split_size'])
-            log.debug("Split %s into %i parts..." % (input_file, split_size))
+            log.debug("Split %s into %i parts...", input_file, split_size)
             # if split_mode = number_of_parts, and split_size = 10, and
             # we know the number of sequences (say 1234), then divide by
             # by ten, giving ten files of approx 123 sequences each.
@@ -416,7 +416,7 @@ class Fasta( Sequence ):
             # Split the input file into as many sub-files as required,
             # each containing to_size many sequences
             batch_size = int(split_params['split_size'])
-            log.debug("Split %s into batches of %i records..." % (input_file, batch_size))
+            log.debug("Split %s into batches of %i records...", input_file, batch_size)
             cls._count_split(input_file, batch_size, subdir_generator_function)
         else:
             raise Exception('Unsupported split mode %s' % split_params['split_mode'])
@@ -428,7 +428,7 @@ class Fasta( Sequence ):
         This does of course preserve complete records - it only splits at the
         start of a new FASTQ sequence record.
         """
-        log.debug("Attemping to split FASTA file %s into chunks of %i bytes" % (input_file, chunk_size))
+        log.debug("Attemping to split FASTA file %s into chunks of %i bytes", input_file, chunk_size)
         f = open(input_file, "rU")
         part_file = None
         try:
@@ -437,7 +437,7 @@ class Fasta( Sequence ):
             part_dir = subdir_generator_function()
             part_path = os.path.join(part_dir, os.path.basename(input_file))
             part_file = open(part_path, 'w')
-            log.debug("Writing %s part to %s" % (input_file, part_path))
+            log.debug("Writing %s part to %s", input_file, part_path)
             start_offset = 0
             while True:
                 offset = f.tell()
@@ -450,11 +450,11 @@ class Fasta( Sequence ):
                     part_dir = subdir_generator_function()
                     part_path = os.path.join(part_dir, os.path.basename(input_file))
                     part_file = open(part_path, 'w')
-                    log.debug("Writing %s part to %s" % (input_file, part_path))
+                    log.debug("Writing %s part to %s", input_file, part_path)
                     start_offset = f.tell()
                 part_file.write(line)
         except Exception as e:
-            log.error('Unable to size split FASTA file: %s' % str(e))
+            log.error('Unable to size split FASTA file: %s', e)
             f.close()
             if part_file is not None:
                 part_file.close()
@@ -464,7 +464,7 @@ class Fasta( Sequence ):
 
     def _count_split(cls, input_file, chunk_size, subdir_generator_function):
         """Split a FASTA file into chunks based on counting records."""
-        log.debug("Attemping to split FASTA file %s into chunks of %i sequences" % (input_file, chunk_size))
+        log.debug("Attemping to split FASTA file %s into chunks of %i sequences", input_file, chunk_size)
         f = open(input_file, "rU")
         part_file = None
         try:
@@ -473,7 +473,7 @@ class Fasta( Sequence ):
             part_dir = subdir_generator_function()
             part_path = os.path.join(part_dir, os.path.basename(input_file))
             part_file = open(part_path, 'w')
-            log.debug("Writing %s part to %s" % (input_file, part_path))
+            log.debug("Writing %s part to %s", input_file, part_path)
             rec_count = 0
             while True:
                 line = f.readline()
@@ -487,12 +487,12 @@ class Fasta( Sequence ):
                         part_dir = subdir_generator_function()
                         part_path = os.path.join(part_dir, os.path.basename(input_file))
                         part_file = open(part_path, 'w')
-                        log.debug("Writing %s part to %s" % (input_file, part_path))
+                        log.debug("Writing %s part to %s", input_file, part_path)
                         rec_count = 1
                 part_file.write(line)
             part_file.close()
         except Exception as e:
-            log.error('Unable to count split FASTA file: %s' % str(e))
+            log.error('Unable to count split FASTA file: %s', e)
             f.close()
             if part_file is not None:
                 part_file.close()
@@ -24,9 +24,7 @@ from galaxy.util import (
 )
 from galaxy.util.checkers import (
     check_binary,
-    check_html,
-    is_bz2,
-    is_gzip
+    check_html
 )
 from galaxy.datatypes.binary import Binary
 
@@ -421,14 +419,12 @@ def guess_ext( fname, sniff_order, is_multi_byte=False ):
 
 def handle_compressed_file( filename, datatypes_registry, ext='auto' ):
     CHUNK_SIZE = 2 ** 20  # 1Mb
-    is_compressed = False
-    compressed_type = None
     keep_compressed = False
     is_valid = False
-    for compressed_type, check_compressed_function in COMPRESSION_CHECK_FUNCTIONS:
-        is_compressed = check_compressed_function( filename )
-        if is_compressed:
-            break  # found compression type
+    # Uncompressed files are ruled out by one header read, compressed ones
+    # are then confirmed by their checker
+    compressed_type = compression_utils.get_compression_type( filename )
+    is_compressed = compressed_type is not None
     if is_compressed:
         if ext in AUTO_DETECT_EXTENSIONS:
             check_exts = COMPRESSION_DATATYPES[ compressed_type ]
@@ -448,7 +444,9 @@ def handle_compressed_file( filename, datatypes_registry, ext='auto' ):
         is_valid = True
     elif not keep_compressed:
         is_valid = True
-        fd, uncompressed = tempfile.mkstemp()
+        # Decompress next to filename so the final move is a rename rather
+        # than a copy from the default temp dir.
+        fd, uncompressed = tempfile.mkstemp( dir=os.path.dirname( os.path.abspath( filename ) ) )
         compressed_file = DECOMPRESSION_FUNCTIONS[ compressed_type ]( filename )
         while True:
             try:
@@ -487,7 +485,8 @@ def handle_uploaded_dataset_file( filename, datatypes_registry, ext='auto', is_m
 
 AUTO_DETECT_EXTENSIONS = [ 'auto' ]  # should 'data' also cause auto detect?
 DECOMPRESSION_FUNCTIONS = dict( gzip=gzip.GzipFile, bz2=bz2.BZ2File )
-COMPRESSION_CHECK_FUNCTIONS = [ ( 'gzip', is_gzip ), ('bz2', is_bz2) ]
+# Deprecated, kept for external callers: use compression_utils.get_compression_type()
+COMPRESSION_CHECK_FUNCTIONS = list( compression_utils.COMPRESSION_MAGIC.values() )
 COMPRESSION_DATATYPES = dict( gzip=[ 'bam', 'fastq.gz', 'fastqsanger.gz', 'fastqillumina.gz', 'fastqsolexa.gz', 'fastqcssanger.gz'], bz2=['fastq.bz2', 'fastqsanger.bz2', 'fastqillumina.bz2', 'fastqsolexa.bz2', 'fastqcssanger.bz2' ] )
 COMPRESSED_EXTENSIONS = []
 for exts in COMPRESSION_DATATYPES.values():
@@ -711,7 +711,7 @@ class Vcf( Tabular ):
         stderr_f = tempfile.NamedTemporaryFile(prefix="bam_merge_stderr")
         stderr_name = stderr_f.name
         command = ["bcftools", "concat"] + split_files + ["-o", output_file]
-        log.info("Merging vcf files with command [%s]" % " ".join(command))
+        log.info("Merging vcf files with command [%s]", " ".join(command))
         exit_code = subprocess.call( args=command, stderr=open( stderr_name, 'wb' ) )
         with open(stderr_name, "rb") as f:
             stderr = f.read().strip()
@@ -17,6 +17,9 @@ from galaxy.util import nice_size, string_as_bool
 
 log = logging.getLogger(__name__)
 
+SNPEFF_VERSION_RE = re.compile(r'^(SnpEff)\s+(\d+\.\d+).*$')
+SNPEFF_REGULATION_RE = re.compile(r'regulation_(.+).bin')
+
 
 class Html( Text ):
     """Class describing an html file"""
@@ -149,7 +152,7 @@ class Ipynb( Json ):
             ofile_handle.close()
             try:
                 cmd = 'jupyter nbconvert --to html --template full %s --output %s' % (dataset.file_name, ofilename)
-                log.info("Calling command %s" % cmd)
+                log.info("Calling command %s", cmd)
                 subprocess.call(cmd, shell=True)
                 ofilename = '%s.html' % ofilename
             except:
@@ -414,7 +417,7 @@ class SnpEffDb( Text ):
             fh = gzip.open(path, 'rb')
             buf = fh.read(100)
             lines = buf.splitlines()
-            m = re.match('^(SnpEff)\s+(\d+\.\d+).*$', lines[0].strip())
+            m = SNPEFF_VERSION_RE.match(lines[0].strip())
             if m:
                 snpeff_version = m.groups()[0] + m.groups()[1]
             fh.close()
@@ -426,7 +429,6 @@ class SnpEffDb( Text ):
         Text.set_meta(self, dataset, **kwd )
         data_dir = dataset.extra_files_path
         # search data_dir/genome_version for files
-        regulation_pattern = 'regulation_(.+).bin'
         #  annotation files that are included in snpEff by a flag
         annotations_dict = {'nextProt.bin': '-nextprot', 'motif.bin': '-motif', 'interactions.bin': '-interaction'}
         regulations = []
@@ -445,7 +447,7 @@ class SnpEffDb( Text ):
                         if snpeff_version:
                             dataset.metadata.snpeff_version = snpeff_version
                     else:
-                        m = re.match(regulation_pattern, fname)
+                        m = SNPEFF_REGULATION_RE.match(fname)
                         if m:
                             name = m.groups()[0]
                             regulations.append(name)
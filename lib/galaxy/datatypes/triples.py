@@ -10,6 +10,11 @@ import binary
 
 log = logging.getLogger(__name__)
 
+NTRIPLES_RE = re.compile( r'<[^>]*>\s<[^>]*>\s<[^>]*>\s\.' )
+TURTLE_PREFIX_RE = re.compile( r'@prefix\s+[^:]*:\s+<[^>]*>\s\.' )
+TURTLE_BASE_RE = re.compile( r'@base\s+<[^>]*>\s\.' )
+RDF_XMLNS_RE = re.compile( r'xmlns:([^=]*)="http://www.w3.org/1999/02/22-rdf-syntax-ns#"' )
+
 
 class Triples( data.Data ):
     """
@@ -45,7 +50,7 @@ class NTriples( data.Text, Triples ):
     def sniff( self, filename ):
         with open(filename, "r") as f:
             # <http://example.org/dir/relfile> <http://www.w3.org/1999/02/22-rdf-syntax-ns#type> <http://example.org/type> .
-            if re.compile( r'<[^>]*>\s<[^>]*>\s<[^>]*>\s\.' ).search( f.readline( 1024 ) ):
+            if NTRIPLES_RE.search( f.readline( 1024 ) ):
                 return True
         return False
 
@@ -93,9 +98,9 @@ class Turtle( data.Text, Triples ):
         with open(filename, "r") as f:
             # @prefix rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#> .
             line = f.readline( 1024 )
-            if re.compile( r'@prefix\s+[^:]*:\s+<[^>]*>\s\.' ).search( line ):
+            if TURTLE_PREFIX_RE.search( line ):
                 return True
-            if re.compile( r'@base\s+<[^>]*>\s\.' ).search( line ):
+            if TURTLE_BASE_RE.search( line ):
                 return True
         return False
 
@@ -121,7 +126,7 @@ class Rdf( xml.GenericXml, Triples ):
         with open(filename, "r") as f:
             firstlines = "".join( f.readlines( 5000 ) )
             # <rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#" ...
-            match = re.compile( r'xmlns:([^=]*)="http://www.w3.org/1999/02/22-rdf-syntax-ns#"' ).search( firstlines )
+            match = RDF_XMLNS_RE.search( firstlines )
             if not match and (match.group(1) + ":RDF") in firstlines:
                 return True
         return False
@@ -41,18 +41,8 @@ class JobImportHistoryArchiveWrapper( object, UsesAnnotations ):
 
         def read_file_contents( file_path ):
             """ Read contents of a file. """
-            fp = open( file_path, 'rb' )
-            buffsize = 1048576
-            file_contents = ''
-            try:
-                while True:
-                    file_contents += fp.read( buffsize )
-                    if not file_contents or len( file_contents ) % buffsize != 0:
-                        break
-            except OverflowError:
-                pass
-            fp.close()
-            return file_contents
+            with open( file_path, 'rb' ) as fp:
+                return fp.read()
 
         def get_tag_str( tag, value ):
             """ Builds a tag string for a tag, value pair. """
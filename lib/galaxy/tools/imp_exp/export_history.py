@@ -34,18 +34,8 @@ def create_archive( history_attrs_file, datasets_attrs_file, jobs_attrs_file, ou
         history_archive = tarfile.open( out_file, tarfile_mode )
 
         # Read datasets attributes from file.
-        datasets_attr_in = open( datasets_attrs_file, 'rb' )
-        datasets_attr_str = ''
-        buffsize = 1048576
-        try:
-            while True:
-                datasets_attr_str += datasets_attr_in.read( buffsize )
-                if not datasets_attr_str or len( datasets_attr_str ) % buffsize != 0:
-                    break
-        except OverflowError:
-            pass
-        datasets_attr_in.close()
-        datasets_attrs = loads( datasets_attr_str )
+        with open( datasets_attrs_file, 'rb' ) as datasets_attr_in:
+            datasets_attrs = loads( datasets_attr_in.read() )
 
         # Add datasets to archive and update dataset attributes.
         # TODO: security check to ensure that files added are in Galaxy dataset directory?
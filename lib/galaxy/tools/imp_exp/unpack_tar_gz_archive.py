@@ -28,7 +28,7 @@ def url_to_file( url, dest_file ):
     """
     try:
         url_reader = urlopen( url )
-        CHUNK = 10 * 1024  # 10k
+        CHUNK = 2 ** 20  # 1Mb
         total = 0
         fp = open( dest_file, 'wb')
         while True:
@@ -36,7 +36,7 @@ def url_to_file( url, dest_file ):
             if not chunk:
                 break
             fp.write( chunk )
-            total += CHUNK
+            total += len( chunk )
             if total > MAX_SIZE:
                 break
         fp.close()
@@ -51,7 +51,7 @@ def check_archive( archive_file, dest_dir ):
     Ensure that a tar archive has no absolute paths or relative paths outside
     the archive.
     """
-    with tarfile.open( archive_file, mode='r:gz' ) as archive_fp:
+    with tarfile.open( archive_file, mode='r:*' ) as archive_fp:
         for arc_path in archive_fp.getnames():
             assert os.path.normpath(
                 os.path.join(
@@ -65,8 +65,10 @@ def check_archive( archive_file, dest_dir ):
 def unpack_archive( archive_file, dest_dir ):
     """
     Unpack a tar and/or gzipped archive into a destination directory.
+
+    The compression (none, gzip or bz2) is detected by tarfile itself.
     """
-    archive_fp = tarfile.open( archive_file, mode='r:gz' )
+    archive_fp = tarfile.open( archive_file, mode='r:*' )
     archive_fp.extractall( path=dest_dir )
     archive_fp.close()
 
@@ -9,6 +9,14 @@ from galaxy import util
 from galaxy.util.image_util import image_type
 
 HTML_CHECK_LINES = 100
+# Compiled once, as a single alternation, so each line is scanned only once.
+HTML_REGEXP = re.compile( "|".join( [
+    "<A\s+[^>]*HREF[^>]+>",
+    "<IFRAME[^>]*>",
+    "<FRAMESET[^>]*>",
+    "<META[\W][^>]*>",
+    "<SCRIPT[^>]*>",
+] ), re.I )
 
 
 def check_html( file_path, chunk=None ):
@@ -16,18 +24,12 @@ def check_html( file_path, chunk=None ):
         temp = open( file_path, "U" )
     else:
         temp = chunk
-    regexp1 = re.compile( "<A\s+[^>]*HREF[^>]+>", re.I )
-    regexp2 = re.compile( "<IFRAME[^>]*>", re.I )
-    regexp3 = re.compile( "<FRAMESET[^>]*>", re.I )
-    regexp4 = re.compile( "<META[\W][^>]*>", re.I )
-    regexp5 = re.compile( "<SCRIPT[^>]*>", re.I )
     lineno = 0
     # TODO: Potentially reading huge lines into string here, this should be
     # reworked.
     for line in temp:
         lineno += 1
-        matches = regexp1.search( line ) or regexp2.search( line ) or regexp3.search( line ) or regexp4.search( line ) or regexp5.search( line )
-        if matches:
+        if HTML_REGEXP.search( line ):
             if chunk is None:
                 temp.close()
             return True
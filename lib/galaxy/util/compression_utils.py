@@ -1,12 +1,41 @@
 import bz2
 import gzip
 import zipfile
+from collections import OrderedDict
 
 from .checkers import (
     is_bz2,
     is_gzip
 )
 
+# Leading bytes of each compression format and the checker that confirms it
+COMPRESSION_MAGIC = OrderedDict([
+    (b'\x1f\x8b', ('gzip', is_gzip)),
+    (b'BZh', ('bz2', is_bz2)),
+])
+MAX_MAGIC_LENGTH = max(len(magic) for magic in COMPRESSION_MAGIC)
+
+
+def get_compression_type(filename):
+    """
+    Return 'gzip' or 'bz2' if filename is compressed with one of these
+    formats, None otherwise.
+
+    The file header is read once and matched against the known magic
+    numbers, so only a file with a matching magic is opened again by its
+    checker.
+    """
+    try:
+        with open(filename, 'rb') as fh:
+            header = fh.read(MAX_MAGIC_LENGTH)
+    except (IOError, OSError):
+        # e.g. a file about to be created by get_fileobj() in 'w' mode
+        return None
+    for magic, (compression_type, check_function) in COMPRESSION_MAGIC.items():
+        if header.startswith(magic) and check_function(filename):
+            return compression_type
+    return None
+
 
 def get_fileobj(filename, mode="r", gzip_only=False, bz2_only=False, zip_only=False):
     """
@@ -24,12 +53,19 @@ def get_fileobj(filename, mode="r", gzip_only=False, bz2_only=False, zip_only=Fa
         cmode = 'r'
     else:
         cmode = mode
-    if not bz2_only and not zip_only and is_gzip(filename):
+    compression_type = get_compression_type(filename)
+    if not bz2_only and not zip_only and compression_type == 'gzip':
         return gzip.GzipFile(filename, cmode)
-    if not gzip_only and not zip_only and is_bz2(filename):
+    if not gzip_only and not zip_only and compression_type == 'bz2':
         return bz2.BZ2File(filename, cmode)
-    if not bz2_only and not gzip_only and zipfile.is_zipfile(filename):
-        # Return fileobj for the first file in a zip file.
-        with zipfile.ZipFile(filename, cmode) as zh:
-            return zh.open(zh.namelist()[0], cmode)
+    if not bz2_only and not gzip_only and cmode == 'r':
+        # Return fileobj for the first file in a zip file. Opening the
+        # archive does the same end-of-file scan as zipfile.is_zipfile(),
+        # so try it directly instead of scanning twice. Only reading is
+        # safe: in 'a' or 'w' mode ZipFile would rewrite a plain file.
+        try:
+            with zipfile.ZipFile(filename, cmode) as zh:
+                return zh.open(zh.namelist()[0], cmode)
+        except zipfile.BadZipfile:
+            pass
     return open(filename, mode)
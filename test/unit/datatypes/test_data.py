@@ -2,10 +2,81 @@
 Unit tests for base DataTypes.
 .. seealso:: galaxy.datatypes.data
 """
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
 
-from galaxy.datatypes.data import get_file_peek
+from six import BytesIO
+
+from galaxy.datatypes.data import Data, get_file_peek, Text
+from galaxy.util.bunch import Bunch
 
 
 def test_get_file_peek( ):
     # should get the first 5 lines of the file without a trailing newline character
     assert get_file_peek('test-data/1.tabular', line_wrap=False) == 'chr22\t1000\tNM_17\nchr22\t2000\tNM_18\nchr10\t2200\tNM_10\nchr10\thap\ttest\nchr10\t1200\tNM_11'
+
+
+def test_get_file_peek_long_lines( ):
+    # lines longer than WIDTH are truncated and the rest of the line skipped
+    with __temp_file() as file_name:
+        with open( file_name, 'w' ) as fh:
+            fh.write( 'a' * 100000 + '\nshort\n' + 'b' * 300 )
+        assert get_file_peek( file_name, line_wrap=False ) == '\n'.join( [ 'a' * 256, 'short', 'b' * 256, '', '' ] )
+
+
+def test_write_from_stream( ):
+    with __temp_file() as file_name:
+        Data().write_from_stream( Bunch( file_name=file_name ), BytesIO( b'\x00\x01binary\ncontent' ) )
+        assert __read( file_name ) == b'\x00\x01binary\ncontent'
+
+
+def test_text_write_from_stream( ):
+    with __temp_file() as file_name:
+        Text().write_from_stream( Bunch( file_name=file_name ), BytesIO( b'a\tb\r\nc\td\re\tf' ) )
+        assert __read( file_name ) == b'a\tb\nc\td\ne\tf\n'
+
+
+def test_text_write_from_stream_across_chunks( ):
+    # a '\r\n' split across the 1MB read boundary is a single line break
+    with __temp_file() as file_name:
+        Text().write_from_stream( Bunch( file_name=file_name ), BytesIO( b'x' * 1048575 + b'\r\ny' ) )
+        assert __read( file_name ) == b'x' * 1048575 + b'\ny\n'
+
+
+def test_merge( ):
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        split_files = []
+        for i, content in enumerate( [ b'part 1\n', b'part 2\n' ] ):
+            split_file = os.path.join( tmp_dir, 'part_%d' % i )
+            with open( split_file, 'wb' ) as fh:
+                fh.write( content )
+            split_files.append( split_file )
+        output_file = os.path.join( tmp_dir, 'merged' )
+        Data.merge( split_files, output_file )
+        assert __read( output_file ) == b'part 1\npart 2\n'
+    finally:
+        shutil.rmtree( tmp_dir )
+
+
+def test_text_set_raw_data( ):
+    with __temp_file() as file_name:
+        Text().set_raw_data( Bunch( file_name=file_name ), b'a\tb\r\nc\td\re\tf' )
+        assert __read( file_name ) == b'a\tb\nc\td\ne\tf\n'
+
+
+@contextmanager
+def __temp_file( ):
+    fd, file_name = tempfile.mkstemp()
+    os.close( fd )
+    try:
+        yield file_name
+    finally:
+        os.remove( file_name )
+
+
+def __read( file_name ):
+    with open( file_name, 'rb' ) as fh:
+        return fh.read()
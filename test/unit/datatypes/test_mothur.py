@@ -0,0 +1,15 @@
+"""
+Unit tests for mothur DataTypes.
+.. seealso:: galaxy.datatypes.mothur
+"""
+from galaxy.datatypes.mothur import SffFlow
+from galaxy.util.bunch import Bunch
+
+
+def test_sff_flow_make_html_table( ):
+    metadata = Bunch( columns=6, flow_order='TACG', delimiter='\t' )
+    dataset = Bunch( metadata=metadata, peek='1\tGQY1XT001CQL4K\t0.5\t1.0\t0.0\t1.1' )
+    out = SffFlow().make_html_table( dataset )
+    # flow columns are numbered after the two leading columns and labelled with their base
+    assert '<tr><th>1. Name</th><th>2. Flows</th><th>3. 1 T</th><th>4. 2 A</th><th>5. 3 C</th><th>6. 4 G</th></tr>' in out
+    assert '<td>GQY1XT001CQL4K</td>' in out
@@ -0,0 +1,97 @@
+import bz2
+import gzip
+import os
+import shutil
+import tempfile
+import zipfile
+from contextlib import contextmanager
+
+from galaxy.util.compression_utils import get_compression_type, get_fileobj
+
+CONTENT = b'chr1\t100\t200\n'
+
+
+def test_plain():
+    with __temp_dir() as temp_dir:
+        path = __write_plain(temp_dir)
+        assert get_compression_type(path) is None
+        __assert_content(get_fileobj(path))
+
+
+def test_gzip():
+    with __temp_dir() as temp_dir:
+        path = os.path.join(temp_dir, 'test.gz')
+        with gzip.open(path, 'wb') as fh:
+            fh.write(CONTENT)
+        assert get_compression_type(path) == 'gzip'
+        __assert_content(get_fileobj(path))
+        __assert_content(get_fileobj(path, gzip_only=True))
+
+
+def test_bz2():
+    with __temp_dir() as temp_dir:
+        path = os.path.join(temp_dir, 'test.bz2')
+        fh = bz2.BZ2File(path, 'wb')
+        fh.write(CONTENT)
+        fh.close()
+        assert get_compression_type(path) == 'bz2'
+        __assert_content(get_fileobj(path))
+        __assert_content(get_fileobj(path, bz2_only=True))
+
+
+def test_zip():
+    with __temp_dir() as temp_dir:
+        path = os.path.join(temp_dir, 'test.zip')
+        with zipfile.ZipFile(path, 'w') as zh:
+            zh.writestr('test.bed', CONTENT)
+        assert get_compression_type(path) is None
+        __assert_content(get_fileobj(path))
+        __assert_content(get_fileobj(path, zip_only=True))
+
+
+def test_plain_other_modes():
+    # Non-read modes must open the plain file and leave it untouched
+    with __temp_dir() as temp_dir:
+        path = __write_plain(temp_dir)
+        __assert_content(get_fileobj(path, 'rb'))
+        fh = get_fileobj(path, 'a')
+        fh.close()
+        with open(path, 'rb') as fh:
+            assert fh.read() == CONTENT
+        fh = get_fileobj(path, 'w')
+        fh.close()
+        assert os.path.getsize(path) == 0
+
+
+def test_new_file_write_mode():
+    with __temp_dir() as temp_dir:
+        path = os.path.join(temp_dir, 'new.bed')
+        assert get_compression_type(path) is None
+        fh = get_fileobj(path, 'w')
+        fh.write(CONTENT)
+        fh.close()
+        with open(path, 'rb') as fh:
+            assert fh.read() == CONTENT
+
+
+def __write_plain(temp_dir):
+    path = os.path.join(temp_dir, 'test.bed')
+    with open(path, 'wb') as fh:
+        fh.write(CONTENT)
+    return path
+
+
+def __assert_content(fh):
+    try:
+        assert fh.read() == CONTENT
+    finally:
+        fh.close()
+
+
+@contextmanager
+def __temp_dir():
+    temp_dir = tempfile.mkdtemp()
+    try:
+        yield temp_dir
+    finally:
+        shutil.rmtree(temp_dir)
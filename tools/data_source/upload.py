@@ -52,6 +52,17 @@ def file_err( msg, dataset, json_file ):
         pass
 
 
+def copy_file( src, dst ):
+    """
+    Like shutil.copy, but copies the data with 1 MB reads instead of the
+    16 KB default, which matters for large uploaded datasets.
+    """
+    with open( src, 'rb' ) as fsrc:
+        with open( dst, 'wb' ) as fdst:
+            shutil.copyfileobj( fsrc, fdst, 2 ** 20 )
+    shutil.copymode( src, dst )
+
+
 def safe_dict(d):
     """
     Recursively clone json structure with UTF-8 dictionary keys
@@ -213,36 +224,22 @@ def add_file( dataset, registry, json_file, output_path ):
                                 stdout = 'ZIP file contained more than one file, only the first file was added to Galaxy.'
                                 break
                             fd, uncompressed = tempfile.mkstemp( prefix='data_id_%s_upload_zip_' % dataset.dataset_id, dir=os.path.dirname( output_path ), text=False )
-                            if sys.version_info[:2] >= ( 2, 6 ):
-                                zipped_file = z.open( name )
-                                while 1:
-                                    try:
-                                        chunk = zipped_file.read( CHUNK_SIZE )
-                                    except IOError:
-                                        os.close( fd )
-                                        os.remove( uncompressed )
-                                        file_err( 'Problem decompressing zipped data', dataset, json_file )
-                                        return
-                                    if not chunk:
-                                        break
-                                    os.write( fd, chunk )
-                                os.close( fd )
-                                zipped_file.close()
-                                uncompressed_name = name
-                                unzipped = True
-                            else:
-                                # python < 2.5 doesn't have a way to read members in chunks(!)
+                            zipped_file = z.open( name )
+                            while 1:
                                 try:
-                                    outfile = open( uncompressed, 'wb' )
-                                    outfile.write( z.read( name ) )
-                                    outfile.close()
-                                    uncompressed_name = name
-                                    unzipped = True
+                                    chunk = zipped_file.read( CHUNK_SIZE )
                                 except IOError:
                                     os.close( fd )
                                     os.remove( uncompressed )
                                     file_err( 'Problem decompressing zipped data', dataset, json_file )
                                     return
+                                if not chunk:
+                                    break
+                                os.write( fd, chunk )
+                            os.close( fd )
+                            zipped_file.close()
+                            uncompressed_name = name
+                            unzipped = True
                         z.close()
                         # Replace the zipped file with the decompressed file if it's safe to do so
                         if uncompressed is not None:
@@ -312,19 +309,17 @@ def add_file( dataset, registry, json_file, output_path ):
     if link_data_only == 'copy_files' and dataset.type in ( 'server_dir', 'path_paste' ) and data_type not in [ 'gzip', 'bz2', 'zip' ]:
         # Move the dataset to its "real" path
         if converted_path is not None:
-            shutil.copy( converted_path, output_path )
-            try:
-                os.remove( converted_path )
-            except:
-                pass
+            # converted_path was created next to output_path (see
+            # output_adjacent_tmpdir), so this is a rename, not a copy.
+            shutil.move( converted_path, output_path )
         else:
             # This should not happen, but it's here just in case
-            shutil.copy( dataset.path, output_path )
+            copy_file( dataset.path, output_path )
     elif link_data_only == 'copy_files':
         if purge_source:
             shutil.move( dataset.path, output_path )
         else:
-            shutil.copy( dataset.path, output_path )
+            copy_file( dataset.path, output_path )
     # Write the job info
     stdout = stdout or 'uploaded %s file' % data_type
     info = dict( type='dataset',